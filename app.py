@@ -6,11 +6,11 @@ from src.rag import PokotRAG
 from src.translator import PokotTranslator
 
 # Page configuration
-st.set_page_config(page_title="Pokot-English Translator", page_icon="🌍", layout="wide")
+st.set_page_config(page_title="Pokot ⇄ English Translator", page_icon="🌍", layout="wide")
 
-st.title("🌍 Pokot-English Neural Translator")
+st.title("🌍 Pokot ⇄ English Neural Translator")
 st.markdown("""
-This application demonstrates a **Retrieval-Augmented Generation (RAG)** approach to translating the low-resource **Pokot** language.
+This application demonstrates a **Retrieval-Augmented Generation (RAG)** approach to translating to and from the low-resource **Pokot** language.
 By leveraging biblical verse alignments, the system provides high-quality contextual examples to a Large Language Model to improve translation accuracy.
 """)
 
@@ -37,7 +37,8 @@ def init_systems():
     print(f"Fetched {len(documents)} documents.")
 
     # 2. Initialize and Index RAG
-    rag = PokotRAG()
+    # QDRANT_URL points at a Qdrant server so payload indexes apply; defaults to in-memory
+    rag = PokotRAG(location=os.getenv("QDRANT_URL", ":memory:"))
     if documents:
         rag.index_documents(documents)
     
@@ -56,8 +57,13 @@ if st.sidebar.button("🔄 Re-fetch & Re-index"):
 
 # Main Translation Interface
 st.subheader("Translation Interface")
-pokot_input = st.text_area("Enter Pokot text to translate:", 
-                           placeholder="e.g., Yomunto, kitɔrɔt Kɔkɔ Pɛlɛl kɔ ayɛng",
+direction_labels = {"Pokot ➡️ English": "pokot_to_english", "English ➡️ Pokot": "english_to_pokot"}
+direction_label = st.radio("Translation direction:", list(direction_labels), horizontal=True)
+direction = direction_labels[direction_label]
+source_language, target_language = ("Pokot", "English") if direction == "pokot_to_english" else ("English", "Pokot")
+
+source_input = st.text_area(f"Enter {source_language} text to translate:", 
+                           placeholder="e.g., Yomunto, kitɔrɔt Kɔkɔ Pɛlɛl kɔ ayɛng" if direction == "pokot_to_english" else "e.g., In the beginning God created the heavens and the earth.",
                            height=150)
 
 col1, col2 = st.columns([1, 3])
@@ -66,11 +72,11 @@ with col1:
     translate_btn = st.button("Translate ➡️", type="primary")
 
 if translate_btn:
-    if pokot_input:
+    if source_input:
         with st.spinner("Processing translation..."):
-            result = translator_system.translate(pokot_input, use_rag=use_rag)
+            result = translator_system.translate(source_input, use_rag=use_rag, direction=direction)
             
-            st.markdown("### English Translation:")
+            st.markdown(f"### {target_language} Translation:")
             st.info(result['translation'])
             
             if use_rag and result['context']:
@@ -85,7 +91,7 @@ if translate_btn:
                             st.markdown(f"*English:* {ctx['english']}")
                         st.divider()
     else:
-        st.warning("Please enter some Pokot text to translate.")
+        st.warning(f"Please enter some {source_language} text to translate.")
 
 # Data Overview Section
 st.divider()
@@ -8,11 +8,83 @@ from qdrant_client import QdrantClient, models
 from sentence_transformers import SentenceTransformer
 from tqdm import tqdm
 
+# USFM book codes (as used by the scraper) grouped by testament and genre.
+OLD_TESTAMENT_BOOKS = [
+    "GEN", "EXO", "LEV", "NUM", "DEU", "JOS", "JDG", "RUT", "1SA", "2SA", "1KI", "2KI",
+    "1CH", "2CH", "EZR", "NEH", "EST", "JOB", "PSA", "PRO", "ECC", "SNG", "ISA", "JER",
+    "LAM", "EZK", "DAN", "HOS", "JOL", "AMO", "OBA", "JON", "MIC", "NAM", "HAB", "ZEP",
+    "HAG", "ZEC", "MAL",
+]
+NEW_TESTAMENT_BOOKS = [
+    "MAT", "MRK", "LUK", "JHN", "ACT", "ROM", "1CO", "2CO", "GAL", "EPH", "PHP", "COL",
+    "1TH", "2TH", "1TI", "2TI", "TIT", "PHM", "HEB", "JAS", "1PE", "2PE", "1JN", "2JN",
+    "3JN", "JUD", "REV",
+]
+TESTAMENTS = ["OT", "NT"]
+BOOK_GENRES = {
+    "law": ["GEN", "EXO", "LEV", "NUM", "DEU"],
+    "narrative": ["JOS", "JDG", "RUT", "1SA", "2SA", "1KI", "2KI", "1CH", "2CH", "EZR", "NEH", "EST", "ACT"],
+    "poetry": ["JOB", "PSA", "PRO", "ECC", "SNG", "LAM"],
+    "prophecy": ["ISA", "JER", "EZK", "DAN", "HOS", "JOL", "AMO", "OBA", "JON", "MIC", "NAM", "HAB",
+                 "ZEP", "HAG", "ZEC", "MAL", "REV"],
+    "gospel": ["MAT", "MRK", "LUK", "JHN"],
+    "epistle": ["ROM", "1CO", "2CO", "GAL", "EPH", "PHP", "COL", "1TH", "2TH", "1TI", "2TI", "TIT",
+                "PHM", "HEB", "JAS", "1PE", "2PE", "1JN", "2JN", "3JN", "JUD"],
+}
+BOOK_TO_GENRE = {book: genre for genre, books in BOOK_GENRES.items() for book in books}
+
+# Translation directions, mapped to (source language, target language).
+# The source language names the vector that is searched and the column that is embedded.
+DIRECTIONS = {
+    "pokot_to_english": ("pokot", "english"),
+    "english_to_pokot": ("english", "pokot"),
+}
+LANGUAGES = ["pokot", "english"]
+
+# Keyword arguments accepted by PokotRAG.build_filter and retrieve_similar as metadata filters.
+FILTER_ARGUMENTS = ["books", "testament", "genre", "chapters"]
+
+# Payload fields that get a Qdrant payload index. Indexes only take effect against a Qdrant server;
+# the local in-memory mode ignores them and scans every point.
+KEYWORD_FIELDS = ["book", "testament", "genre"]
+INTEGER_FIELDS = ["chapter", "verse"]
+
+
+def _to_int(value):
+    '''Converts a chapter/verse value to int, returning None when it is missing or malformed.'''
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def get_languages(direction):
+    '''Returns the (source, target) languages for a translation direction, raising ValueError if it is unknown.'''
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown direction '{direction}'. Expected one of: {', '.join(DIRECTIONS)}")
+    return DIRECTIONS[direction]
+
+
+def get_testament(book):
+    '''Returns "OT" or "NT" (see TESTAMENTS) for a USFM book code, or None if the code is unknown.'''
+    if book in OLD_TESTAMENT_BOOKS:
+        return "OT"
+    if book in NEW_TESTAMENT_BOOKS:
+        return "NT"
+    return None
+
+
 class PokotRAG:
-    '''Handles the retrieval of similar Pokot-English verse pairs.'''
-    def __init__(self, collection_name="pokot_verses", model_name="paraphrase-multilingual-MiniLM-L12-v2"):
-        # Use an in-memory Qdrant client for simplicity. For production, you might use a Dockerized instance.
-        self.client = QdrantClient(":memory:")
+    '''
+    Handles the retrieval of similar Pokot-English verse pairs.
+    Both languages are embedded into one collection as named vectors over a single shared payload,
+    so the same index serves Pokot->English and English->Pokot retrieval.
+    '''
+    def __init__(self, collection_name="pokot_verses", model_name="paraphrase-multilingual-MiniLM-L12-v2", location=":memory:"):
+        # Defaults to an in-memory Qdrant client for simplicity. Pass a server URL (e.g. "http://localhost:6333")
+        # as location for production; payload indexes, and so index-backed filtering, only apply on a server.
+        self.client = QdrantClient(location=location)
+        self.is_local = location == ":memory:"
         self.collection_name = collection_name
         print(f"Loading sentence transformer model: {model_name}")
         self.model = SentenceTransformer(model_name)
@@ -21,10 +93,108 @@ class PokotRAG:
         # Initialize the collection in the vector database
         self.client.recreate_collection(
             collection_name=self.collection_name,
-            vectors_config=models.VectorParams(size=self.vector_size, distance=models.Distance.COSINE),
+            vectors_config={
+                language: models.VectorParams(size=self.vector_size, distance=models.Distance.COSINE)
+                for language in LANGUAGES
+            },
         )
         print(f"Qdrant collection '{self.collection_name}' created.")
 
+        # Index the structured metadata fields so filters are resolved via the payload index.
+        # The local in-memory client ignores payload indexes, so they are only created on a server.
+        if not self.is_local:
+            for field in KEYWORD_FIELDS:
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field,
+                    field_schema=models.PayloadSchemaType.KEYWORD,
+                )
+            for field in INTEGER_FIELDS:
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field,
+                    field_schema=models.PayloadSchemaType.INTEGER,
+                )
+
+    @staticmethod
+    def build_payload(doc):
+        '''Builds the stored payload for a verse, with structured (filterable) metadata fields.'''
+        book = doc.get('book')
+        book = book.strip().upper() if isinstance(book, str) and book.strip() else None
+        chapter = _to_int(doc.get('chapter'))
+        verse = _to_int(doc.get('verse'))
+        reference = " ".join([
+            book or 'N/A',
+            f"{'N/A' if chapter is None else chapter}:{'N/A' if verse is None else verse}",
+        ])
+        return {
+            "pokot": doc['pokot'],
+            "english": doc['english'],
+            "reference": reference,
+            "book": book,
+            "chapter": chapter,
+            "verse": verse,
+            "testament": get_testament(book),
+            "genre": BOOK_TO_GENRE.get(book),
+        }
+
+    @staticmethod
+    def build_filter(books=None, testament=None, genre=None, chapters=None):
+        '''
+        Builds a Qdrant filter from metadata constraints, or returns None if there are none.
+
+        Args:
+            books (str or list): One or more USFM book codes to restrict to (e.g. ["GEN", "PSA"]).
+            testament (str): "OT" or "NT".
+            genre (str or list): One or more genres from BOOK_GENRES (e.g. "poetry").
+            chapters (tuple): Inclusive (start, end) chapter range; either bound may be None.
+
+        Raises:
+            ValueError: If any value is not a known book, testament or genre, or chapters is not a valid range.
+        '''
+        conditions = []
+        if books:
+            codes = []
+            for book in ([books] if isinstance(books, str) else books):
+                code = book.upper() if isinstance(book, str) else book
+                if code not in OLD_TESTAMENT_BOOKS and code not in NEW_TESTAMENT_BOOKS:
+                    raise ValueError(f"Unknown book '{book}'. Expected USFM codes such as: {', '.join(OLD_TESTAMENT_BOOKS + NEW_TESTAMENT_BOOKS)}")
+                codes.append(code)
+            conditions.append(models.FieldCondition(
+                key="book", match=models.MatchAny(any=codes)
+            ))
+        if testament:
+            testament = testament.upper() if isinstance(testament, str) else testament
+            if testament not in TESTAMENTS:
+                raise ValueError(f"Unknown testament '{testament}'. Expected one of: {', '.join(TESTAMENTS)}")
+            conditions.append(models.FieldCondition(
+                key="testament", match=models.MatchValue(value=testament)
+            ))
+        if genre:
+            genres = [g.lower() if isinstance(g, str) else g for g in ([genre] if isinstance(genre, str) else genre)]
+            for g in genres:
+                if g not in BOOK_GENRES:
+                    raise ValueError(f"Unknown genre '{g}'. Expected one of: {', '.join(BOOK_GENRES)}")
+            conditions.append(models.FieldCondition(
+                key="genre", match=models.MatchAny(any=genres)
+            ))
+        if chapters is not None:
+            if not isinstance(chapters, (tuple, list)) or len(chapters) != 2:
+                raise ValueError(f"chapters must be a (start, end) tuple, got {chapters!r}")
+            start, end = chapters
+            for bound in (start, end):
+                if bound is not None and (not isinstance(bound, int) or isinstance(bound, bool)):
+                    raise ValueError(f"chapters bounds must be integers or None, got {chapters!r}")
+            # An open range on both sides would only drop verses with no chapter, so add no condition
+            if start is not None or end is not None:
+                conditions.append(models.FieldCondition(
+                    key="chapter", range=models.Range(gte=start, lte=end)
+                ))
+
+        if not conditions:
+            return None
+        return models.Filter(must=conditions)
+
     def index_documents(self, documents):
         '''Indexes a list of verse dictionaries into the vector database.'''
         if not documents:
@@ -48,21 +218,18 @@ class PokotRAG:
             return
 
         print(f"Indexing {len(valid_documents)} valid documents (out of {len(documents)} total)...")
-        texts = [doc['pokot'] for doc in valid_documents]
-        
-        print("Generating embeddings for Pokot verses...")
-        embeddings = self.model.encode(texts, show_progress_bar=True, batch_size=32)
+        embeddings = {}
+        for language in LANGUAGES:
+            texts = [doc[language] for doc in valid_documents]
+            print(f"Generating embeddings for {language.capitalize()} verses...")
+            embeddings[language] = self.model.encode(texts, show_progress_bar=True, batch_size=32)
 
         print("Indexing verses into Qdrant...")
         points = [
             models.PointStruct(
                 id=idx,
-                vector=embeddings[idx].tolist(),
-                payload={
-                    "pokot": doc['pokot'],
-                    "english": doc['english'],
-                    "reference": f"{doc.get('book', 'N/A')} {doc.get('chapter', 'N/A')}:{doc.get('verse', 'N/A')}"
-                }
+                vector={language: embeddings[language][idx].tolist() for language in LANGUAGES},
+                payload=self.build_payload(doc)
             )
             for idx, doc in enumerate(tqdm(valid_documents, desc="Upserting points"))
         ]
@@ -85,25 +252,37 @@ class PokotRAG:
         documents = df.to_dict('records')
         self.index_documents(documents)
 
-    def retrieve_similar(self, query_text, top_k=3):
-        '''Retrieves the top-k most similar verses for a given Pokot text.'''
+    def retrieve_similar(self, query_text, top_k=3, direction="pokot_to_english",
+                         books=None, testament=None, genre=None, chapters=None):
+        '''
+        Retrieves the top-k most similar verses for a given source text.
+        The direction ("pokot_to_english" or "english_to_pokot") selects which language's vectors are searched.
+        Optional metadata filters (see build_filter) restrict the search to matching verses.
+        '''
+        source_language, _ = get_languages(direction)
+        query_filter = self.build_filter(books=books, testament=testament, genre=genre, chapters=chapters)
         if not query_text:
             return []
             
         query_vector = self.model.encode(query_text).tolist()
 
-        search_result = self.client.search(
+        search_result = self.client.query_points(
             collection_name=self.collection_name,
-            query_vector=query_vector,
+            query=query_vector,
+            using=source_language,
+            query_filter=query_filter,
             limit=top_k,
             with_payload=True
-        )
+        ).points
 
         results = [
             {
                 "pokot": hit.payload["pokot"],
                 "english": hit.payload["english"],
                 "reference": hit.payload["reference"],
+                "book": hit.payload.get("book"),
+                "chapter": hit.payload.get("chapter"),
+                "verse": hit.payload.get("verse"),
                 "score": hit.score
             }
             for hit in search_result
@@ -137,3 +316,17 @@ if __name__ == "__main__":
     print("Retrieved similar verses:")
     for verse in similar_verses:
         print(verse)
+
+    # 4. Perform a retrieval restricted to Old Testament law books
+    filtered_verses = rag_system.retrieve_similar(test_query, top_k=1, testament="OT", genre="law")
+    print("Retrieved similar verses (OT law only):")
+    for verse in filtered_verses:
+        print(verse)
+
+    # 5. Perform a retrieval in the reverse direction using the same index
+    english_query = "In the beginning God created"
+    reverse_verses = rag_system.retrieve_similar(english_query, top_k=1, direction="english_to_pokot")
+    print(f"\nQuery: \"{english_query}\"")
+    print("Retrieved similar verses (English->Pokot):")
+    for verse in reverse_verses:
+        print(verse)
@@ -3,10 +3,10 @@ This module handles the translation logic, combining RAG with an LLM (Claude Hai
 '''
 import vertexai
 from vertexai.generative_models import GenerativeModel
-from src.rag import PokotRAG
+from src.rag import PokotRAG, get_languages, FILTER_ARGUMENTS
 
 class PokotTranslator:
-    '''Translates Pokot text to English using a RAG-enhanced LLM approach with Vertex AI.'''
+    '''Translates between Pokot and English (either direction) using a RAG-enhanced LLM approach with Vertex AI.'''
     def __init__(self, rag_system=None, project_id="auth-4eef8", location="us-central1"):
         # Initialize Vertex AI
         vertexai.init(project=project_id, location=location)
@@ -14,37 +14,55 @@ class PokotTranslator:
         self.model = GenerativeModel("gemini-2.5-flash")
         self.rag = rag_system if rag_system else PokotRAG()
         
-    def construct_prompt(self, pokot_text, context_verses):
-        '''Constructs a prompt for the LLM with retrieved context.'''
+    def construct_prompt(self, source_text, context_verses, direction="pokot_to_english"):
+        '''Constructs a prompt for the LLM with retrieved context, ordered for the given direction.'''
+        source, target = (language.capitalize() for language in get_languages(direction))
+
         context_str = ""
         if context_verses:
             context_str = "Use the following similar biblical verses as context for vocabulary and style:\n\n"
             for i, verse in enumerate(context_verses):
-                context_str += f"Example {i+1} (Reference: {verse['reference'] if 'reference' in verse else 'N/A'}):\nPokot: {verse.get('pokot', '')}\nEnglish: {verse.get('english', '')}\n\n"
+                context_str += f"Example {i+1} (Reference: {verse['reference'] if 'reference' in verse else 'N/A'}):\n{source}: {verse.get(source.lower(), '')}\n{target}: {verse.get(target.lower(), '')}\n\n"
 
         prompt = f"""You are an expert translator specializing in the Pokot language (a Nilotic language spoken in Kenya and Uganda).
-Your task is to translate the following Pokot text into English.
+Your task is to translate the following {source} text into {target}.
 
 {context_str}
-Pokot text to translate:
-"{pokot_text}"
+{source} text to translate:
+"{source_text}"
 
-Provide only the English translation. Do not include any explanations or additional text.
-English Translation:"""
+Provide only the {target} translation. Do not include any explanations or additional text.
+{target} Translation:"""
         return prompt
 
-    def translate(self, pokot_text, use_rag=True):
+    def translate(self, source_text, use_rag=True, retrieval_filters=None, direction="pokot_to_english"):
         '''
-        Translates Pokot text to English using Gemini Flash.
+        Translates text between Pokot and English using Gemini Flash.
+        direction is "pokot_to_english" (default) or "english_to_pokot"; both use the same RAG index.
+        retrieval_filters is an optional dict of metadata filters passed to PokotRAG.retrieve_similar
+        (e.g. {"testament": "OT", "genre": "poetry"}).
+        An invalid direction, unknown filter key or (when use_rag is set) invalid filter value raises ValueError.
         '''
+        # Validate arguments up front so they are not swallowed by the retrieval error handling below
+        get_languages(direction)
+        retrieval_filters = retrieval_filters or {}
+        unknown = set(retrieval_filters) - set(FILTER_ARGUMENTS)
+        if unknown:
+            raise ValueError(f"Unknown retrieval filter(s): {', '.join(sorted(unknown))}. Expected any of: {', '.join(FILTER_ARGUMENTS)}")
+
         context_verses = []
         if use_rag:
             try:
-                context_verses = self.rag.retrieve_similar(pokot_text, top_k=3)
+                context_verses = self.rag.retrieve_similar(
+                    source_text, top_k=3, direction=direction, **retrieval_filters
+                )
+            except ValueError:
+                # Invalid filter values are caller errors, not retrieval failures
+                raise
             except Exception as e:
                 print(f"RAG retrieval error: {e}")
 
-        prompt = self.construct_prompt(pokot_text, context_verses)
+        prompt = self.construct_prompt(source_text, context_verses, direction=direction)
 
         try:
             response = self.model.generate_content(prompt)
@@ -76,4 +94,6 @@ if __name__ == "__main__":
     
     # 3. Translate
     # result = translator.translate("Yomunto, kitɔrɔt Kɔkɔ Pɛlɛl")
+    # print(f"Translation: {result['translation']}")
+    # result = translator.translate("In the beginning God created", direction="english_to_pokot")
     # print(f"Translation: {result['translation']}")
\ No newline at end of file
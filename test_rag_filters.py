@@ -0,0 +1,72 @@
+from qdrant_client import models
+from src.rag import PokotRAG, get_testament, BOOK_TO_GENRE
+
+def test_testament_and_genre_mapping():
+    assert get_testament("GEN") == "OT"
+    assert get_testament("MAT") == "NT"
+    assert get_testament("XYZ") is None
+    assert BOOK_TO_GENRE["PSA"] == "poetry"
+    assert BOOK_TO_GENRE["ROM"] == "epistle"
+
+def test_build_payload_normalizes_metadata():
+    payload = PokotRAG.build_payload({'pokot': 'p', 'english': 'e', 'book': 'gen', 'chapter': 1.0, 'verse': '3'})
+    assert payload['book'] == "GEN"
+    assert payload['chapter'] == 1
+    assert payload['verse'] == 3
+    assert payload['reference'] == "GEN 1:3"
+    assert payload['testament'] == "OT"
+    assert payload['genre'] == "law"
+
+def test_build_payload_handles_missing_metadata():
+    nan = float('nan')
+    payload = PokotRAG.build_payload({'pokot': 'p', 'english': 'e', 'book': nan, 'chapter': nan, 'verse': float('inf')})
+    assert payload['book'] is None
+    assert payload['chapter'] is None
+    assert payload['verse'] is None
+    assert payload['reference'] == "N/A N/A:N/A"
+    assert payload['testament'] is None
+    assert payload['genre'] is None
+
+def test_build_filter_without_constraints():
+    assert PokotRAG.build_filter() is None
+
+def test_build_filter_conditions():
+    query_filter = PokotRAG.build_filter(books=["gen", "psa"], testament="ot", genre="Poetry", chapters=(1, 5))
+    conditions = {condition.key: condition for condition in query_filter.must}
+    assert conditions["book"].match == models.MatchAny(any=["GEN", "PSA"])
+    assert conditions["testament"].match == models.MatchValue(value="OT")
+    assert conditions["genre"].match == models.MatchAny(any=["poetry"])
+    assert conditions["chapter"].range == models.Range(gte=1, lte=5)
+
+def test_build_filter_single_book_string():
+    query_filter = PokotRAG.build_filter(books="gen")
+    assert query_filter.must[0].match == models.MatchAny(any=["GEN"])
+
+def test_build_filter_chapter_ranges():
+    assert PokotRAG.build_filter(chapters=(None, None)) is None
+    assert PokotRAG.build_filter(chapters=(3, None)).must[0].range == models.Range(gte=3)
+    assert PokotRAG.build_filter(chapters=(None, 7)).must[0].range == models.Range(lte=7)
+
+def test_build_filter_rejects_invalid_values():
+    invalid = (
+        {'books': ["XYZ"]}, {'books': [1]}, {'books': "ABC"},
+        {'testament': "old"}, {'genre': "fiction"}, {'genre': ["poetry", "fiction"]},
+        {'chapters': 5}, {'chapters': (1, 2, 3)}, {'chapters': ("1", 5)}, {'chapters': (1.5, None)},
+    )
+    for kwargs in invalid:
+        try:
+            PokotRAG.build_filter(**kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f"build_filter accepted invalid arguments: {kwargs}")
+
+if __name__ == "__main__":
+    test_testament_and_genre_mapping()
+    test_build_payload_normalizes_metadata()
+    test_build_payload_handles_missing_metadata()
+    test_build_filter_without_constraints()
+    test_build_filter_conditions()
+    test_build_filter_single_book_string()
+    test_build_filter_chapter_ranges()
+    test_build_filter_rejects_invalid_values()
+    print("SUCCESS: RAG metadata and filter checks passed.")
@@ -0,0 +1,53 @@
+from src.rag import PokotRAG
+from src.translator import PokotTranslator
+
+CONTEXT = [{'pokot': 'Otini le towunöt', 'english': 'In the beginning', 'reference': 'GEN 1:1'}]
+
+def make_translator():
+    # Skip __init__ so no Vertex AI project or RAG model is needed to build prompts
+    translator = PokotTranslator.__new__(PokotTranslator)
+    translator.rag = PokotRAG.__new__(PokotRAG)
+    return translator
+
+def assert_raises_value_error(calls):
+    for call in calls:
+        try:
+            call()
+        except ValueError:
+            continue
+        raise AssertionError("expected ValueError")
+
+def test_english_to_pokot_prompt():
+    prompt = make_translator().construct_prompt("In the beginning", CONTEXT, direction="english_to_pokot")
+    assert prompt.index("English: In the beginning") < prompt.index("Pokot: Otini le towunöt")
+    assert "translate the following English text into Pokot" in prompt
+    assert prompt.endswith("Pokot Translation:")
+
+def test_pokot_to_english_prompt():
+    prompt = make_translator().construct_prompt("Otini le towunöt", CONTEXT)
+    assert prompt.index("Pokot: Otini le towunöt") < prompt.index("English: In the beginning")
+    assert prompt.endswith("English Translation:")
+
+def test_unknown_direction_raises():
+    translator = make_translator()
+    assert_raises_value_error((
+        lambda: translator.construct_prompt("text", CONTEXT, direction="pokot_to_swahili"),
+        lambda: translator.translate("text", direction="pokot_to_swahili"),
+    ))
+
+def test_invalid_retrieval_filters_raise():
+    translator = make_translator()
+    assert_raises_value_error((
+        lambda: translator.translate("text", retrieval_filters={'direction': "english_to_pokot"}),
+        lambda: translator.translate("text", retrieval_filters={'top_k': 5}),
+        lambda: translator.translate("text", retrieval_filters={'book': "GEN"}),
+        lambda: translator.translate("text", retrieval_filters={'testament': "old"}),
+        lambda: translator.translate("text", retrieval_filters={'books': [1]}),
+    ))
+
+if __name__ == "__main__":
+    test_english_to_pokot_prompt()
+    test_pokot_to_english_prompt()
+    test_unknown_direction_raises()
+    test_invalid_retrieval_filters_raise()
+    print("SUCCESS: Translator prompt checks passed.")